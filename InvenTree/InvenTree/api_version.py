@@ -2,11 +2,20 @@
 
 
 # InvenTree API version
-INVENTREE_API_VERSION = 151
+INVENTREE_API_VERSION = 153
 """Increment this API version number whenever there is a significant change to the API that any clients need to know about."""
 
 INVENTREE_API_TEXT = """
 
+v153 -> 2026-10-14
+    - Barcode scan requests are only accepted at /api/barcode/ and /api/barcode/scan/
+    - Requests to any other (unknown) /api/barcode/<path>/ endpoint now return HTTP 404
+
+v152 -> 2026-10-14
+    - Barcode hashes (barcode_hash) are now calculated using BLAKE2b (128-bit digest) instead of MD5
+    - Barcodes which were assigned using the legacy MD5 hash are still matched when scanned
+    - Matching against the legacy MD5 barcode hash is deprecated, and will be removed in a future release
+
 v151 -> 2023-11-13 : https://github.com/inventree/InvenTree/pull/5906
     - Allow user list API to be filtered by user active status
     - Allow owner list API to be filtered by user active status
@@ -1,5 +1,6 @@
 """Provides helper functions used throughout the InvenTree project."""
 
+import functools
 import hashlib
 import io
 import json
@@ -774,11 +775,53 @@ def hash_barcode(barcode_data):
 
     We first remove any non-printable characters from the barcode data,
     as some browsers have issues scanning characters in.
+
+    The hash is a (128-bit) BLAKE2b digest, which is the same width as the
+    MD5 hash used by older versions, but considerably faster to calculate.
+
+    The same barcode is typically hashed several times while handling a single request,
+    so the results are cached (for barcode data up to BARCODE_HASH_CACHE_MAX_LENGTH characters).
+    """
+    return _hash_barcode(str(barcode_data))
+
+
+def hash_barcode_legacy(barcode_data):
+    """Calculate the legacy (MD5) hash for a barcode string.
+
+    Barcodes assigned by older versions of InvenTree are stored against this hash,
+    so it is still checked when looking up a barcode.
     """
-    barcode_data = str(barcode_data).strip()
-    barcode_data = remove_non_printable_characters(barcode_data)
+    return _hash_barcode(str(barcode_data), legacy=True)
+
+
+# Barcode data is provided by the client, and could be arbitrarily large.
+# Only shorter strings (which covers any real barcode) are kept in the hash cache,
+# so that the memory used by the cache stays bounded.
+BARCODE_HASH_CACHE_MAX_LENGTH = 512
 
-    hash = hashlib.md5(str(barcode_data).encode())
+
+def _hash_barcode(barcode_data: str, legacy: bool = False) -> str:
+    """Calculate the barcode hash for an (unprocessed) barcode string, using the cache where possible."""
+    if len(barcode_data) > BARCODE_HASH_CACHE_MAX_LENGTH:
+        return _calculate_barcode_hash(barcode_data, legacy)
+
+    return _hash_barcode_string(barcode_data, legacy)
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_barcode_string(barcode_data: str, legacy: bool = False) -> str:
+    """Calculate (and cache) the barcode hash for a short barcode string."""
+    return _calculate_barcode_hash(barcode_data, legacy)
+
+
+def _calculate_barcode_hash(barcode_data: str, legacy: bool = False) -> str:
+    """Calculate the barcode hash for an (unprocessed) barcode string."""
+    barcode_data = remove_non_printable_characters(barcode_data.strip()).encode()
+
+    if legacy:
+        hash = hashlib.md5(barcode_data)
+    else:
+        hash = hashlib.blake2b(barcode_data, digest_size=16)
 
     return str(hash.hexdigest())
 
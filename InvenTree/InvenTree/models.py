@@ -934,8 +934,14 @@ class InvenTreeBarcodeMixin(models.Model):
 
     - barcode_data : Raw data associated with an assigned barcode
     - barcode_hash : A 'hash' of the assigned barcode data used to improve matching
+
+    Models can specify BARCODE_SELECT_RELATED, the related fields which are accessed when
+    the instance is saved (e.g. during model validation), so that they are fetched with the instance.
     """
 
+    # Related fields to fetch when a barcode is assigned to (or unassigned from) an instance
+    BARCODE_SELECT_RELATED = ()
+
     class Meta:
         """Metaclass options for this mixin.
 
@@ -975,9 +981,21 @@ class InvenTreeBarcodeMixin(models.Model):
         return self.format_barcode(brief=True)
 
     @classmethod
-    def lookup_barcode(cls, barcode_hash):
-        """Check if a model instance exists with the specified third-party barcode hash."""
-        return cls.objects.filter(barcode_hash=barcode_hash).first()
+    def lookup_barcode(cls, barcode_hash, barcode_data=None):
+        """Check if a model instance exists with the specified third-party barcode hash.
+
+        If the raw barcode_data is also provided, barcodes which were assigned using
+        the legacy (MD5) hash are also matched.
+        """
+        if barcode_data is None:
+            return cls.objects.filter(barcode_hash=barcode_hash).first()
+
+        # Barcodes assigned before API v152 are stored with the legacy MD5 hash.
+        # These cannot all be re-hashed with a data migration, as the raw barcode_data is not stored for every row
+        # (e.g. hashes carried over from the old StockItem.uid field), so they are matched using the raw data here.
+        legacy_hash = InvenTree.helpers.hash_barcode_legacy(barcode_data)
+
+        return cls.objects.filter(barcode_hash__in=[barcode_hash, legacy_hash]).first()
 
     def assign_barcode(self, barcode_hash=None, barcode_data=None, raise_error=True, save=True):
         """Assign an external (third-party) barcode to this object."""
@@ -990,7 +1008,7 @@ class InvenTreeBarcodeMixin(models.Model):
             barcode_hash = InvenTree.helpers.hash_barcode(barcode_data)
 
         # Check for existing item
-        if self.__class__.lookup_barcode(barcode_hash) is not None:
+        if self.__class__.lookup_barcode(barcode_hash, barcode_data=barcode_data) is not None:
             if raise_error:
                 raise ValidationError(_("Existing barcode found"))
             else:
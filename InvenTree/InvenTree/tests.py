@@ -1198,14 +1198,57 @@ class BarcodeMixinTest(InvenTreeTestCase):
         # Test multiple values for the hashing function
         # This is to ensure that the hash function is always "backwards compatible"
         hashing_tests = {
+            'abcdefg': '23acc48d16b0f655c7b792515040e954',
+            'ABCDEFG': 'd2d8698217399c306717b845882f1369',
+            '1234567': '10436a6c3bfc3f9f077d3b7404438fb2',
+            '{"part": 17, "stockitem": 12}': 'effc0e811dc896f6d68f55b0a4ed0f75',
+        }
+
+        for barcode, hash in hashing_tests.items():
+            self.assertEqual(InvenTree.helpers.hash_barcode(barcode), hash)
+
+        # Legacy (MD5) hashes must also remain stable, as they are used to lookup existing barcodes
+        legacy_tests = {
             'abcdefg': '7ac66c0f148de9519b8bd264312c4d64',
             'ABCDEFG': 'bb747b3df3130fe1ca4afa93fb7d97c9',
             '1234567': 'fcea920f7412b5da7be0cf42b8c93759',
             '{"part": 17, "stockitem": 12}': 'c88c11ed0628eb7fef0d59b098b96975',
         }
 
-        for barcode, hash in hashing_tests.items():
-            self.assertEqual(InvenTree.helpers.hash_barcode(barcode), hash)
+        for barcode, hash in legacy_tests.items():
+            self.assertEqual(InvenTree.helpers.hash_barcode_legacy(barcode), hash)
+
+    def test_barcode_hash_cache(self):
+        """Test that only short barcode strings are kept in the barcode hash cache"""
+        from InvenTree.helpers import (BARCODE_HASH_CACHE_MAX_LENGTH,
+                                       _hash_barcode_string)
+
+        _hash_barcode_string.cache_clear()
+
+        short_barcode = 'x' * BARCODE_HASH_CACHE_MAX_LENGTH
+        long_barcode = 'x' * (BARCODE_HASH_CACHE_MAX_LENGTH + 1)
+
+        InvenTree.helpers.hash_barcode(short_barcode)
+        InvenTree.helpers.hash_barcode(short_barcode)
+
+        info = _hash_barcode_string.cache_info()
+        self.assertEqual(info.currsize, 1)
+        self.assertEqual(info.hits, 1)
+
+        # Long strings are hashed correctly, but are not kept in the cache
+        for _ in range(2):
+            self.assertEqual(
+                InvenTree.helpers.hash_barcode(long_barcode),
+                InvenTree.helpers._calculate_barcode_hash(long_barcode)
+            )
+            self.assertEqual(
+                InvenTree.helpers.hash_barcode_legacy(long_barcode),
+                InvenTree.helpers._calculate_barcode_hash(long_barcode, legacy=True)
+            )
+
+        info = _hash_barcode_string.cache_info()
+        self.assertEqual(info.currsize, 1)
+        self.assertEqual(info.hits, 1)
 
 
 class SanitizerTest(TestCase):
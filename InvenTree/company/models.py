@@ -586,6 +586,9 @@ class SupplierPart(MetadataMixin, InvenTreeBarcodeMixin, common.models.MetaMixin
 
     objects = SupplierPartManager()
 
+    # Related fields which are accessed by SupplierPart.clean()
+    BARCODE_SELECT_RELATED = ('part', 'manufacturer_part__part')
+
     tags = TaggableManager(blank=True)
 
     @staticmethod
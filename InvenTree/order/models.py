@@ -291,6 +291,9 @@ class PurchaseOrder(TotalPriceMixin, Order):
         target_date: Expected delivery target date for PurchaseOrder completion (optional)
     """
 
+    # The supplier currency is accessed when the total price is updated on save
+    BARCODE_SELECT_RELATED = ('supplier',)
+
     def get_absolute_url(self):
         """Get the 'web' URL for this order"""
         return reverse('po-detail', kwargs={'pk': self.pk})
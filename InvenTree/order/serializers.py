@@ -551,7 +551,7 @@ class PurchaseOrderLineItemReceiveSerializer(serializers.Serializer):
 
         barcode_hash = hash_barcode(barcode)
 
-        if stock.models.StockItem.lookup_barcode(barcode_hash) is not None:
+        if stock.models.StockItem.lookup_barcode(barcode_hash, barcode_data=barcode) is not None:
             raise ValidationError(_('Barcode is already in use'))
 
         return barcode
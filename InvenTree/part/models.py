@@ -358,6 +358,9 @@ class Part(InvenTreeBarcodeMixin, InvenTreeNotesMixin, MetadataMixin, MPTTModel)
 
     objects = PartManager()
 
+    # Related fields which are accessed by Part.clean()
+    BARCODE_SELECT_RELATED = ('category',)
+
     tags = TaggableManager(blank=True)
 
     class Meta:
@@ -1,8 +1,12 @@
 """API endpoints for barcode plugins."""
 
+import functools
 import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
-from django.urls import path, re_path
+from django.urls import path
+from django.utils.text import format_lazy
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import permissions
@@ -10,7 +14,7 @@ from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from InvenTree.helpers import hash_barcode
+from InvenTree.helpers import hash_barcode, hash_barcode_legacy
 from order.models import PurchaseOrder
 from plugin import registry
 from plugin.builtin.barcodes.inventree_barcode import \
@@ -21,6 +25,276 @@ from users.models import RuleSet
 logger = logging.getLogger('inventree')
 
 
+@dataclass(frozen=True)
+class BarcodeModel:
+    """Static barcode information for a single database model which supports barcodes.
+
+    Response messages are constructed (lazily translated) once here, rather than for each request.
+
+    Attributes:
+        model: The database model class
+        label: Barcode label for the model (e.g. 'stockitem')
+        table: Ruleset table name for the model (e.g. 'stock_stockitem')
+        assigned_msg: Message returned when a barcode is assigned to a model instance
+        unassigned_msg: Message returned when a barcode is unassigned from a model instance
+        no_match_msg: Message returned when no matching model instance is found
+        perm_denied_msg: Message returned when the user cannot change the model instance
+    """
+
+    model: Any
+    label: str
+    table: str
+    assigned_msg: Any
+    unassigned_msg: Any
+    no_match_msg: Any
+    perm_denied_msg: Any
+
+
+def _build_barcode_model(model) -> BarcodeModel:
+    """Construct barcode information for the provided model."""
+    label = model.barcode_model_type()
+    table = f"{model._meta.app_label}_{model._meta.model_name}"
+
+    return BarcodeModel(
+        model=model,
+        label=label,
+        table=table,
+        assigned_msg=format_lazy(_("Assigned barcode to {label} instance"), label=label),
+        unassigned_msg=format_lazy(_("Barcode unassigned from {label} instance"), label=label),
+        no_match_msg=format_lazy(_("No matching {label} instance found in database"), label=label),
+        perm_denied_msg=format_lazy(_("You do not have the required permissions for {table}"), table=table),
+    )
+
+
+@dataclass(frozen=True)
+class BarcodeModelMeta:
+    """Static barcode information for the database models which support barcodes.
+
+    Attributes:
+        models: The supported database models
+        meta: BarcodeModel entry for each supported model
+        labels: Barcode label for each supported model
+        label_set: Set of supported labels (for fast intersection with request data)
+        label_map: Maps each supported label to the BarcodeModel entry
+        model_names: Comma separated list of the supported labels
+    """
+
+    models: tuple
+    meta: tuple
+    labels: tuple
+    label_set: frozenset
+    label_map: dict
+    model_names: str
+
+
+@functools.lru_cache(maxsize=1)
+def _build_barcode_model_meta(models: tuple) -> BarcodeModelMeta:
+    """Construct barcode information for the provided set of models."""
+    meta = tuple(_build_barcode_model(model) for model in models)
+
+    labels = tuple(entry.label for entry in meta)
+
+    return BarcodeModelMeta(
+        models=models,
+        meta=meta,
+        labels=labels,
+        label_set=frozenset(labels),
+        label_map={entry.label: entry for entry in meta},
+        model_names=', '.join(labels),
+    )
+
+
+def get_barcode_model_meta() -> BarcodeModelMeta:
+    """Return barcode information for all supported models.
+
+    This is only rebuilt when the set of supported models changes (i.e. on plugin registry reload).
+    """
+    return _build_barcode_model_meta(InvenTreeInternalBarcodePlugin.get_supported_barcode_models())
+
+
+@functools.lru_cache(maxsize=4)
+def _order_barcode_plugins(plugins: tuple) -> tuple:
+    """Sort the provided barcode plugins so that the internal InvenTree plugin comes first."""
+    return tuple(sorted(plugins, key=lambda plugin: not isinstance(plugin, InvenTreeInternalBarcodePlugin)))
+
+
+def get_barcode_plugins(builtin=None) -> tuple:
+    """Return the available barcode plugins, with the internal InvenTree plugin first.
+
+    Internal barcodes are by far the most common case,
+    so trying the internal plugin first means that most scans only require a single plugin call.
+    """
+    return _order_barcode_plugins(registry.with_mixin('barcode', builtin=builtin))
+
+
+@functools.lru_cache(maxsize=4)
+def get_barcode_scanners(plugins: tuple, method: str = 'scan') -> tuple:
+    """Return (plugin, can_handle, scan) tuples of bound methods for the provided barcode plugins.
+
+    The bound methods are only constructed once for each set of plugins (i.e. until the registry is reloaded).
+
+    Arguments:
+        plugins: Tuple of barcode plugins (in order)
+        method: Name of the scan method to bind (e.g. 'scan_receive_item')
+    """
+    return tuple((plugin, plugin.can_handle, getattr(plugin, method)) for plugin in plugins)
+
+
+def _find_scan_match(results, method: str = 'scan'):
+    """Return the (plugin, plugin_name, result) of the first successful barcode scan.
+
+    Empty results are ignored. If no plugin matched the barcode, the first error result is returned instead.
+    If no plugin returned a result at all, (None, None, {}) is returned.
+
+    The plugin name is only resolved (once) for plugins which return a result,
+    and is used for both logging and the response.
+
+    Arguments:
+        results: Iterable of (plugin, result) pairs, which is only consumed up to the first match
+        method: Name of the scan method which produced the results (for logging)
+    """
+    first_error = None
+
+    def matches():
+        """Yield successful results, recording only the first error result."""
+        nonlocal first_error
+
+        for plugin, result in results:
+            if result is None:
+                continue
+
+            plugin_name = plugin.name
+
+            if "error" in result:
+                # Avoid formatting the log message if INFO logging is disabled
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("%s.%s(...) returned an error: %s",
+                                plugin_name, method, result["error"])
+
+                if first_error is None:
+                    first_error = (plugin, plugin_name, result)
+            else:
+                yield plugin, plugin_name, result
+
+    match = next(matches(), None)
+
+    if match is not None:
+        return match
+
+    if first_error is not None:
+        return first_error
+
+    return None, None, {}
+
+
+@dataclass()
+class BarcodeRequest:
+    """Data provided to a barcode API endpoint.
+
+    Attributes:
+        barcode: The raw barcode data
+        purchase_order: Primary key of the provided purchase order (if any)
+        location: Primary key of the provided stock location (if any)
+        labels: Values provided for any supported barcode model labels (e.g. 'stockitem')
+    """
+
+    barcode: Any = None
+    purchase_order: Optional[int] = None
+    location: Optional[int] = None
+    labels: dict = field(default_factory=dict)
+
+
+def _parse_pk(data, key, error):
+    """Extract an (optional) integer primary key from the provided request data."""
+    value = data.get(key)
+
+    if value in [None, '']:
+        return None
+
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValidationError({key: error})
+
+
+def _parse_barcode_request(request, require_barcode=True, parse_pks=False) -> BarcodeRequest:
+    """Parse and validate the data provided to a barcode API endpoint.
+
+    The request data is only accessed once.
+
+    Arguments:
+        request: The API request
+        require_barcode: If True, raise a ValidationError if no barcode data is provided
+        parse_pks: If True, coerce the 'purchase_order' and 'location' primary keys to integers
+    """
+    data = request.data
+
+    barcode = data.get('barcode', None)
+
+    if require_barcode and not barcode:
+        raise ValidationError({'barcode': _('Missing barcode data')})
+
+    if parse_pks:
+        # Note: only the po-receive endpoint uses these values, other endpoints ignore them
+        purchase_order = _parse_pk(data, 'purchase_order', _('Invalid purchase order'))
+        location = _parse_pk(data, 'location', _('Invalid stock location'))
+    else:
+        purchase_order = None
+        location = None
+
+    return BarcodeRequest(
+        barcode=barcode,
+        purchase_order=purchase_order,
+        location=location,
+        # Only the supported labels which are present in the request data are extracted
+        labels={label: data[label] for label in get_barcode_model_meta().label_set & data.keys()},
+    )
+
+
+def _barcode_hash_assigned(barcode_data, barcode_hash) -> bool:
+    """Check if the barcode hash is assigned to an instance of any supported model.
+
+    All supported models are checked with a single (UNION ALL) database query on the barcode hash field.
+    As with InvenTreeBarcodeMixin.lookup_barcode, the legacy (MD5) hash is also matched.
+    """
+    hashes = [barcode_hash, hash_barcode_legacy(barcode_data)]
+
+    querysets = [
+        entry.model.objects.filter(barcode_hash__in=hashes).values('pk')
+        for entry in get_barcode_model_meta().meta
+    ]
+
+    if not querysets:
+        return False
+
+    return querysets[0].union(*querysets[1:], all=True).exists()
+
+
+def _get_barcode_instance(model, pk):
+    """Fetch the model instance which a barcode is being assigned to (or unassigned from).
+
+    Related fields specified by BARCODE_SELECT_RELATED are fetched with the instance.
+    Note: select_related() is only called if related fields are specified,
+    as calling it without arguments follows *every* non-null foreign key.
+    """
+    queryset = model.objects.all()
+
+    if model.BARCODE_SELECT_RELATED:
+        queryset = queryset.select_related(*model.BARCODE_SELECT_RELATED)
+
+    return queryset.get(pk=pk)
+
+
+def get_internal_barcode_plugin():
+    """Return the internal InvenTree barcode plugin (or None if it is not loaded)."""
+    plugins = get_barcode_plugins(builtin=True)
+
+    if plugins and isinstance(plugins[0], InvenTreeInternalBarcodePlugin):
+        return plugins[0]
+
+    return None
+
+
 class BarcodeScan(APIView):
     """Endpoint for handling generic barcode scan requests.
 
@@ -39,7 +313,7 @@ class BarcodeScan(APIView):
     (more information to follow)
 
     hashing:
-    Barcode hashes are calculated using MD5
+    Barcode hashes are calculated using BLAKE2b (128-bit digest)
     """
 
     permission_classes = [
@@ -51,43 +325,23 @@ class BarcodeScan(APIView):
 
         Check if required info was provided and then run though the plugin steps or try to match up-
         """
-        data = request.data
-
-        barcode_data = data.get('barcode', None)
-
-        if not barcode_data:
-            raise ValidationError({'barcode': _('Missing barcode data')})
+        barcode_data = _parse_barcode_request(request).barcode
 
-        # Note: the default barcode handlers are loaded (and thus run) first
-        plugins = registry.with_mixin('barcode')
-
-        barcode_hash = hash_barcode(barcode_data)
+        # Note: the internal barcode handler is run first
+        scanners = get_barcode_scanners(get_barcode_plugins())
 
         # Look for a barcode plugin which knows how to deal with this barcode
-        plugin = None
-        response = {}
-
-        for current_plugin in plugins:
-
-            result = current_plugin.scan(barcode_data)
+        plugin, plugin_name, response = _find_scan_match(
+            (plugin, scan(barcode_data))
+            for plugin, can_handle, scan in scanners
+            if can_handle(barcode_data)
+        )
 
-            if result is None:
-                continue
-
-            if "error" in result:
-                logger.info("%s.scan(...) returned an error: %s",
-                            current_plugin.__class__.__name__, result["error"])
-                if not response:
-                    plugin = current_plugin
-                    response = result
-            else:
-                plugin = current_plugin
-                response = result
-                break
-
-        response['plugin'] = plugin.name if plugin else None
+        response['plugin'] = plugin_name
         response['barcode_data'] = barcode_data
-        response['barcode_hash'] = barcode_hash
+
+        # Note: the hash is required by the client even if no match is found
+        response['barcode_hash'] = hash_barcode(barcode_data)
 
         # A plugin has not been found!
         if plugin is None:
@@ -115,18 +369,26 @@ class BarcodeAssign(APIView):
 
         Checks inputs and assign barcode (hash) to StockItem.
         """
-        data = request.data
+        data = _parse_barcode_request(request)
 
-        barcode_data = data.get('barcode', None)
+        barcode_data = data.barcode
 
-        if not barcode_data:
-            raise ValidationError({'barcode': _('Missing barcode data')})
+        barcode_hash = hash_barcode(barcode_data)
 
         # Here we only check against 'InvenTree' plugins
-        plugins = registry.with_mixin('barcode', builtin=True)
+        plugins = get_barcode_plugins(builtin=True)
 
         # First check if the provided barcode matches an existing database entry
         for plugin in plugins:
+            if isinstance(plugin, InvenTreeInternalBarcodePlugin):
+                # Most barcodes being assigned are not yet known to the database,
+                # so a full scan (to construct the detailed error) is only required for internal barcode data,
+                # or if the barcode hash is already assigned
+                if not plugin.matches_prefix(barcode_data) and not _barcode_hash_assigned(barcode_data, barcode_hash):
+                    continue
+            elif not plugin.can_handle(barcode_data):
+                continue
+
             result = plugin.scan(barcode_data)
 
             if result is not None:
@@ -136,51 +398,45 @@ class BarcodeAssign(APIView):
 
                 raise ValidationError(result)
 
-        barcode_hash = hash_barcode(barcode_data)
+        barcode_models = get_barcode_model_meta()
+
+        # Find the (first) supported model type which was provided
+        for entry in barcode_models.meta:
+            if entry.label in data.labels:
+                break
+        else:
+            # If we got here, it means that no valid model types were provided
+            raise ValidationError({
+                'error': f"Missing data: provide one of '{barcode_models.model_names}'",
+            })
+
+        model = entry.model
 
-        valid_labels = []
-
-        for model in InvenTreeInternalBarcodePlugin.get_supported_barcode_models():
-            label = model.barcode_model_type()
-            valid_labels.append(label)
-
-            if label in data:
-                try:
-                    instance = model.objects.get(pk=data[label])
-
-                    # Check that the user has the required permission
-                    app_label = model._meta.app_label
-                    model_name = model._meta.model_name
-
-                    table = f"{app_label}_{model_name}"
-
-                    if not RuleSet.check_table_permission(request.user, table, "change"):
-                        raise PermissionDenied({
-                            "error": f"You do not have the required permissions for {table}"
-                        })
-
-                    instance.assign_barcode(
-                        barcode_data=barcode_data,
-                        barcode_hash=barcode_hash,
-                    )
-
-                    return Response({
-                        'success': f"Assigned barcode to {label} instance",
-                        label: {
-                            'pk': instance.pk,
-                        },
-                        "barcode_data": barcode_data,
-                        "barcode_hash": barcode_hash,
-                    })
-
-                except (ValueError, model.DoesNotExist):
-                    raise ValidationError({
-                        'error': f"No matching {label} instance found in database",
-                    })
-
-        # If we got here, it means that no valid model types were provided
-        raise ValidationError({
-            'error': f"Missing data: provide one of '{valid_labels}'",
+        try:
+            instance = _get_barcode_instance(model, data.labels[entry.label])
+        except (ValueError, model.DoesNotExist):
+            raise ValidationError({
+                'error': entry.no_match_msg,
+            })
+
+        # Check that the user has the required permission
+        if not RuleSet.check_table_permission(request.user, entry.table, "change"):
+            raise PermissionDenied({
+                "error": entry.perm_denied_msg,
+            })
+
+        instance.assign_barcode(
+            barcode_data=barcode_data,
+            barcode_hash=barcode_hash,
+        )
+
+        return Response({
+            'success': entry.assigned_msg,
+            entry.label: {
+                'pk': instance.pk,
+            },
+            "barcode_data": barcode_data,
+            "barcode_hash": barcode_hash,
         })
 
 
@@ -194,62 +450,47 @@ class BarcodeUnassign(APIView):
     def post(self, request, *args, **kwargs):
         """Respond to a barcode unassign POST request"""
         # The following database models support assignment of third-party barcodes
-        supported_models = InvenTreeInternalBarcodePlugin.get_supported_barcode_models()
+        barcode_models = get_barcode_model_meta()
 
-        supported_labels = [model.barcode_model_type() for model in supported_models]
-        model_names = ', '.join(supported_labels)
+        model_names = barcode_models.model_names
 
-        data = request.data
+        data = _parse_barcode_request(request, require_barcode=False)
 
-        matched_labels = []
-
-        for label in supported_labels:
-            if label in data:
-                matched_labels.append(label)
-
-        if len(matched_labels) == 0:
+        # Note: data.labels only contains the supported labels which were provided
+        if len(data.labels) == 0:
             raise ValidationError({
                 'error': f"Missing data: Provide one of '{model_names}'"
             })
 
-        if len(matched_labels) > 1:
+        if len(data.labels) > 1:
             raise ValidationError({
                 'error': f"Multiple conflicting fields: '{model_names}'",
             })
 
         # At this stage, we know that we have received a single valid field
-        for model in supported_models:
-            label = model.barcode_model_type()
-
-            if label in data:
-                try:
-                    instance = model.objects.get(pk=data[label])
-                except (ValueError, model.DoesNotExist):
-                    raise ValidationError({
-                        label: _('No match found for provided value')
-                    })
-
-                # Check that the user has the required permission
-                app_label = model._meta.app_label
-                model_name = model._meta.model_name
-
-                table = f"{app_label}_{model_name}"
-
-                if not RuleSet.check_table_permission(request.user, table, "change"):
-                    raise PermissionDenied({
-                        "error": f"You do not have the required permissions for {table}"
-                    })
-
-                # Unassign the barcode data from the model instance
-                instance.unassign_barcode()
-
-                return Response({
-                    'success': f'Barcode unassigned from {label} instance',
-                })
-
-        # If we get to this point, something has gone wrong!
-        raise ValidationError({
-            'error': 'Could not unassign barcode',
+        (label,) = data.labels
+
+        entry = barcode_models.label_map[label]
+        model = entry.model
+
+        try:
+            instance = _get_barcode_instance(model, data.labels[entry.label])
+        except (ValueError, model.DoesNotExist):
+            raise ValidationError({
+                entry.label: _('No match found for provided value')
+            })
+
+        # Check that the user has the required permission
+        if not RuleSet.check_table_permission(request.user, entry.table, "change"):
+            raise PermissionDenied({
+                "error": entry.perm_denied_msg,
+            })
+
+        # Unassign the barcode data from the model instance
+        instance.unassign_barcode()
+
+        return Response({
+            'success': entry.unassigned_msg,
         })
 
 
@@ -276,67 +517,69 @@ class BarcodePOReceive(APIView):
     def post(self, request, *args, **kwargs):
         """Respond to a barcode POST request."""
 
-        data = request.data
+        data = _parse_barcode_request(request, parse_pks=True)
 
-        if not (barcode_data := data.get("barcode")):
-            raise ValidationError({"barcode": _("Missing barcode data")})
+        barcode_data = data.barcode
 
         logger.debug("BarcodePOReceive: scanned barcode - '%s'", barcode_data)
 
+        # Look just for "supplier-barcode" plugins
+        plugins = registry.with_mixin("supplier-barcode")
+
+        # Model instances are only fetched if at least one plugin requires them
+        # Otherwise, only the existence of the provided primary key is checked
         purchase_order = None
 
-        if purchase_order_pk := data.get("purchase_order"):
-            purchase_order = PurchaseOrder.objects.filter(pk=purchase_order_pk).first()
-            if not purchase_order:
+        if purchase_order_pk := data.purchase_order:
+            if any(plugin.needs_purchase_order_instance for plugin in plugins):
+                # The supplier is compared against the barcode plugin supplier, so fetch it here too
+                purchase_order = PurchaseOrder.objects.select_related('supplier').filter(pk=purchase_order_pk).first()
+                exists = purchase_order is not None
+            else:
+                exists = PurchaseOrder.objects.filter(pk=purchase_order_pk).values_list('pk', flat=True).first() is not None
+
+            if not exists:
                 raise ValidationError({"purchase_order": _("Invalid purchase order")})
 
         location = None
-        if (location_pk := data.get("location")):
-            location = StockLocation.objects.get(pk=location_pk)
-            if not location:
-                raise ValidationError({"location": _("Invalid stock location")})
-
-        plugins = registry.with_mixin("barcode")
-
-        # Look for a barcode plugin which knows how to deal with this barcode
-        plugin = None
-        response = {}
 
-        internal_barcode_plugin = next(filter(
-            lambda plugin: plugin.name == "InvenTreeBarcode", plugins))
-        if internal_barcode_plugin.scan(barcode_data):
-            response["error"] = _("Item has already been received")
-            raise ValidationError(response)
-
-        # Now, look just for "supplier-barcode" plugins
-        plugins = registry.with_mixin("supplier-barcode")
+        if location_pk := data.location:
+            if any(plugin.needs_location_instance for plugin in plugins):
+                location = StockLocation.objects.filter(pk=location_pk).first()
+                exists = location is not None
+            else:
+                exists = StockLocation.objects.filter(pk=location_pk).values_list('pk', flat=True).first() is not None
 
-        for current_plugin in plugins:
+            if not exists:
+                raise ValidationError({"location": _("Invalid stock location")})
 
-            result = current_plugin.scan_receive_item(
-                barcode_data,
-                request.user,
-                purchase_order=purchase_order,
-                location=location,
-            )
+        # Check that the barcode does not match an existing item.
+        # Note: JSON decoding is skipped by the internal plugin for non-internal barcode data,
+        # but assigned (third-party) barcodes must still be checked
+        internal_barcode_plugin = get_internal_barcode_plugin()
 
-            if result is None:
-                continue
+        if internal_barcode_plugin and internal_barcode_plugin.scan(barcode_data):
+            raise ValidationError({"error": _("Item has already been received")})
 
-            if "error" in result:
-                logger.info("%s.scan_receive_item(...) returned an error: %s",
-                            current_plugin.__class__.__name__, result["error"])
-                if not response:
-                    plugin = current_plugin
-                    response = result
-            else:
-                plugin = current_plugin
-                response = result
-                break
+        scanners = get_barcode_scanners(plugins, 'scan_receive_item')
 
-        response["plugin"] = plugin.name if plugin else None
+        # Look for a barcode plugin which knows how to deal with this barcode
+        plugin, plugin_name, response = _find_scan_match(
+            (
+                (plugin, scan_receive_item(
+                    barcode_data,
+                    request.user,
+                    purchase_order=purchase_order if plugin.needs_purchase_order_instance else purchase_order_pk,
+                    location=location if plugin.needs_location_instance else location_pk,
+                ))
+                for plugin, can_handle, scan_receive_item in scanners
+                if can_handle(barcode_data)
+            ),
+            'scan_receive_item',
+        )
+
+        response["plugin"] = plugin_name
         response["barcode_data"] = barcode_data
-        response["barcode_hash"] = hash_barcode(barcode_data)
 
         # A plugin has not been found!
         if plugin is None:
@@ -345,6 +588,7 @@ class BarcodePOReceive(APIView):
         elif "error" in response:
             raise ValidationError(response)
         else:
+            response["barcode_hash"] = hash_barcode(barcode_data)
             return Response(response)
 
 
@@ -358,6 +602,9 @@ barcode_api_urls = [
     # Receive a purchase order item by scanning its barcode
     path("po-receive/", BarcodePOReceive.as_view(), name="api-barcode-po-receive"),
 
-    # Catch-all performs barcode 'scan'
-    re_path(r'^.*$', BarcodeScan.as_view(), name='api-barcode-scan'),
+    # Explicit 'scan' endpoint (alias for the default endpoint below)
+    path('scan/', BarcodeScan.as_view()),
+
+    # Default endpoint performs barcode 'scan'
+    path('', BarcodeScan.as_view(), name='api-barcode-scan'),
 ]
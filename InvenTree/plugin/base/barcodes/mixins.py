@@ -40,6 +40,16 @@ class BarcodeMixin:
         """Does this plugin have everything needed to process a barcode."""
         return True
 
+    def can_handle(self, barcode_data) -> bool:
+        """Cheaply determine if this plugin could match the provided barcode data.
+
+        Plugins which only support particular barcode formats can override this with a fast
+        check (e.g. for a known prefix), so that scan() is not called for data it cannot match.
+
+        Default return value is True
+        """
+        return True
+
     def scan(self, barcode_data):
         """Scan a barcode against this plugin.
 
@@ -59,8 +69,16 @@ class SupplierBarcodeMixin(BarcodeMixin):
 
     Custom supplier barcode plugins should use this mixin and implement the
     extract_barcode_fields function.
+
+    A plugin which overrides scan_receive_item and only requires the primary key of the
+    purchase order (or stock location) can set needs_purchase_order_instance (or needs_location_instance)
+    to False. The primary key is then passed instead of a model instance, which saves a database lookup.
     """
 
+    # The default scan_receive_item implementation requires full model instances
+    needs_purchase_order_instance = True
+    needs_location_instance = True
+
     # Set of standard field names which can be extracted from the barcode
     CUSTOMER_ORDER_NUMBER = "customer_order_number"
     SUPPLIER_ORDER_NUMBER = "supplier_order_number"
@@ -314,14 +332,29 @@ class SupplierBarcodeMixin(BarcodeMixin):
 
         return barcode_data.split(delimiter)
 
+    # ISO/IEC 15434 barcode format
+    ISOIEC_15434_HEADER = "[)>\x1E06\x1D"
+    ISOIEC_15434_TRAILER = "\x1E\x04"
+    ISOIEC_15434_DELIMITER = "\x1D"
+
+    # Some old mouser barcodes start with this messed up header
+    ISOIEC_15434_OLD_MOUSER_HEADER = ">[)>06\x1D"
+
+    @classmethod
+    def is_isoiec_15434_barcode2d(cls, barcode_data) -> bool:
+        """Determine if the provided data starts with a ISO/IEC 15434 barcode header."""
+        barcode_data = str(barcode_data).strip()
+
+        return barcode_data.startswith((cls.ISOIEC_15434_HEADER, cls.ISOIEC_15434_OLD_MOUSER_HEADER))
+
     @staticmethod
     def parse_isoiec_15434_barcode2d(barcode_data: str) -> list[str]:
         """Parse a ISO/IEC 15434 barcode, returning the split data section."""
 
-        OLD_MOUSER_HEADER = ">[)>06\x1D"
-        HEADER = "[)>\x1E06\x1D"
-        TRAILER = "\x1E\x04"
-        DELIMITER = "\x1D"
+        OLD_MOUSER_HEADER = SupplierBarcodeMixin.ISOIEC_15434_OLD_MOUSER_HEADER
+        HEADER = SupplierBarcodeMixin.ISOIEC_15434_HEADER
+        TRAILER = SupplierBarcodeMixin.ISOIEC_15434_TRAILER
+        DELIMITER = SupplierBarcodeMixin.ISOIEC_15434_DELIMITER
 
         # Some old mouser barcodes start with this messed up header
         if barcode_data.startswith(OLD_MOUSER_HEADER):
@@ -75,6 +75,16 @@ class BarcodeAPITest(InvenTreeAPITestCase):
         self.assertIn('barcode_data', response.data)
         self.assertEqual(response.data['part']['pk'], 1)
 
+    def test_scan_endpoints(self):
+        """Test that the scan endpoint is available at both supported URLs."""
+        self.assertEqual(self.scan_url, '/api/barcode/')
+
+        for url in [self.scan_url, '/api/barcode/scan/']:
+            response = self.client.post(url, {'barcode': {'part': 1}}, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data['part']['pk'], 1)
+
     def test_invalid_part(self):
         """Test response for invalid part."""
         response = self.client.post(
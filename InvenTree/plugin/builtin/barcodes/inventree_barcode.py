@@ -7,6 +7,7 @@ Parsing an InvenTree barcode simply involves validating that the
 references model objects actually exist in the database.
 """
 
+import functools
 import json
 
 from django.utils.translation import gettext_lazy as _
@@ -14,10 +15,19 @@ from django.utils.translation import gettext_lazy as _
 from InvenTree.helpers import hash_barcode
 from InvenTree.helpers_model import getModelsWithMixin
 from InvenTree.models import InvenTreeBarcodeMixin
-from plugin import InvenTreePlugin
+from plugin import InvenTreePlugin, registry
 from plugin.mixins import BarcodeMixin
 
 
+@functools.lru_cache(maxsize=1)
+def _get_supported_barcode_models(registry_version: int) -> tuple:
+    """Find the barcode models for a given version of the plugin registry.
+
+    Plugins may provide their own database models, so the result is keyed on the registry version.
+    """
+    return tuple(getModelsWithMixin(InvenTreeBarcodeMixin))
+
+
 class InvenTreeInternalBarcodePlugin(BarcodeMixin, InvenTreePlugin):
     """Builtin BarcodePlugin for matching and generating internal barcodes."""
 
@@ -30,7 +40,24 @@ class InvenTreeInternalBarcodePlugin(BarcodeMixin, InvenTreePlugin):
     @staticmethod
     def get_supported_barcode_models():
         """Returns a list of database models which support barcode functionality"""
-        return getModelsWithMixin(InvenTreeBarcodeMixin)
+        models = _get_supported_barcode_models(registry.registry_version)
+
+        if not models:
+            # Do not hold on to an empty result (e.g. database not yet migrated)
+            _get_supported_barcode_models.cache_clear()
+
+        return models
+
+    @staticmethod
+    def matches_prefix(barcode_data) -> bool:
+        """Cheaply determine if the provided data could be an internal InvenTree barcode.
+
+        Internal barcodes are JSON objects, so anything else can skip JSON decoding entirely.
+        """
+        if type(barcode_data) is dict:
+            return True
+
+        return type(barcode_data) is str and barcode_data.lstrip().startswith('{')
 
     def format_matched_response(self, label, model, instance):
         """Format a response for the scanned data"""
@@ -72,7 +99,7 @@ class InvenTreeInternalBarcodePlugin(BarcodeMixin, InvenTreePlugin):
 
         if type(barcode_data) is dict:
             barcode_dict = barcode_data
-        elif type(barcode_data) is str:
+        elif self.matches_prefix(barcode_data):
             try:
                 barcode_dict = json.loads(barcode_data)
             except json.JSONDecodeError:
@@ -95,7 +122,7 @@ class InvenTreeInternalBarcodePlugin(BarcodeMixin, InvenTreePlugin):
         for model in self.get_supported_barcode_models():
             label = model.barcode_model_type()
 
-            instance = model.lookup_barcode(barcode_hash)
+            instance = model.lookup_barcode(barcode_hash, barcode_data=barcode_data)
 
             if instance is not None:
                 return self.format_matched_response(label, model, instance)
@@ -4,7 +4,10 @@ from django.urls import reverse
 
 import part.models
 import stock.models
+from InvenTree.helpers import hash_barcode, hash_barcode_legacy
 from InvenTree.unit_test import InvenTreeAPITestCase
+from plugin.builtin.barcodes.inventree_barcode import \
+    InvenTreeInternalBarcodePlugin
 
 
 class TestInvenTreeBarcode(InvenTreeAPITestCase):
@@ -165,7 +168,7 @@ class TestInvenTreeBarcode(InvenTreeAPITestCase):
         si = stock.models.StockItem.objects.get(pk=521)
 
         self.assertEqual(si.barcode_data, bc_data)
-        self.assertEqual(si.barcode_hash, "2f5dba5c83a360599ba7665b2a4131c6")
+        self.assertEqual(si.barcode_hash, "b48c391aa6d6765f4ac28a1ea1b59d1a")
 
         # Now test that we cannot assign this barcode to something else
         response = self.assign(
@@ -233,7 +236,7 @@ class TestInvenTreeBarcode(InvenTreeAPITestCase):
         # Check that the Part instance has been updated
         p = part.models.Part.objects.get(pk=1)
         self.assertEqual(p.barcode_data, 'xyz-123')
-        self.assertEqual(p.barcode_hash, 'bc39d07e9a395c7b5658c231bf910fae')
+        self.assertEqual(p.barcode_hash, '886a1ceaa0712763a719765b7ac66fac')
 
         # Scanning the barcode should now reveal the 'Part' instance
         response = self.scan(
@@ -258,6 +261,22 @@ class TestInvenTreeBarcode(InvenTreeAPITestCase):
 
         self.assertIn('Barcode matches existing item', str(response.data['error']))
 
+        # The same barcode cannot be assigned to a different model type either
+        self.assignRole('stock.change')
+
+        response = self.assign(
+            {
+                'barcode': barcode,
+                'stockitem': 1,
+            },
+            expected_code=400,
+        )
+
+        self.assertIn('Barcode matches existing item', str(response.data['error']))
+        # Note: the error response is raised as a ValidationError, so all values are strings
+        self.assertEqual(response.data['plugin'], 'InvenTreeBarcode')
+        self.assertEqual(str(response.data['part']['pk']), '1')
+
         self.assignRole('part.change')
 
         # Now test that we can unassign the barcode data also
@@ -304,7 +323,7 @@ class TestInvenTreeBarcode(InvenTreeAPITestCase):
         loc = stock.models.StockLocation.objects.get(pk=1)
 
         self.assertEqual(loc.barcode_data, barcode)
-        self.assertEqual(loc.barcode_hash, '4aa63f5e55e85c1f842796bf74896dbb')
+        self.assertEqual(loc.barcode_hash, 'cace6932acc8597d3a713ced359f2e59')
 
         # Check that an error is thrown if we try to assign the same value again
         response = self.assign(
@@ -357,6 +376,31 @@ class TestInvenTreeBarcode(InvenTreeAPITestCase):
             self.assertIn('success', response.data)
             self.assertEqual(response.data['stockitem']['pk'], 1)
 
+    def test_scan_legacy_hash(self):
+        """Test that barcodes assigned with the legacy (MD5) hash are still matched"""
+        barcode = 'legacy-barcode-data'
+
+        si = stock.models.StockItem.objects.get(pk=1)
+        si.barcode_data = barcode
+        si.barcode_hash = hash_barcode_legacy(barcode)
+        si.save()
+
+        response = self.scan({'barcode': barcode}, expected_code=200)
+
+        self.assertEqual(response.data['stockitem']['pk'], 1)
+        self.assertEqual(response.data['barcode_hash'], hash_barcode(barcode))
+
+        # The legacy barcode cannot be assigned to another item
+        response = self.assign(
+            data={
+                'barcode': barcode,
+                'stockitem': 521,
+            },
+            expected_code=400,
+        )
+
+        self.assertIn('Barcode matches existing item', str(response.data['error']))
+
     def test_scan_inventree(self):
         """Test scanning of first-party barcodes"""
         # Scan a StockItem object (which does not exist)
@@ -419,3 +463,11 @@ class TestInvenTreeBarcode(InvenTreeAPITestCase):
         self.assertIn('success', response.data)
         self.assertIn('barcode_data', response.data)
         self.assertIn('barcode_hash', response.data)
+
+    def test_matches_prefix(self):
+        """Test detection of internal barcode data"""
+        for barcode in ['{"part": 1}', '  {"stockitem": 5}', {'part': 1}]:
+            self.assertTrue(InvenTreeInternalBarcodePlugin.matches_prefix(barcode))
+
+        for barcode in ['blbla=10004', '[)>\x1e06\x1dP123', '', 123, None]:
+            self.assertFalse(InvenTreeInternalBarcodePlugin.matches_prefix(barcode))
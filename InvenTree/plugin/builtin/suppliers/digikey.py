@@ -28,6 +28,10 @@ class DigiKeyPlugin(SupplierBarcodeMixin, SettingsMixin, InvenTreePlugin):
         }
     }
 
+    def can_handle(self, barcode_data) -> bool:
+        """Only ISO/IEC 15434 barcodes are supported by DigiKey."""
+        return self.is_isoiec_15434_barcode2d(barcode_data)
+
     def extract_barcode_fields(self, barcode_data) -> dict[str, str]:
         """Extract barcode fields from a DigiKey plugin"""
 
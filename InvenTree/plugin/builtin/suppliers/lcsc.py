@@ -39,6 +39,12 @@ class LCSCPlugin(SupplierBarcodeMixin, SettingsMixin, InvenTreePlugin):
         "on": SupplierBarcodeMixin.CUSTOMER_ORDER_NUMBER,
     }
 
+    def can_handle(self, barcode_data) -> bool:
+        """LCSC barcodes are always enclosed in curly braces."""
+        barcode_data = str(barcode_data).strip()
+
+        return barcode_data.startswith('{') and barcode_data.endswith('}')
+
     def extract_barcode_fields(self, barcode_data: str) -> dict[str, str]:
         """Get supplier_part and barcode_fields from LCSC QR-Code.
 
@@ -27,6 +27,10 @@ class MouserPlugin(SupplierBarcodeMixin, SettingsMixin, InvenTreePlugin):
         }
     }
 
+    def can_handle(self, barcode_data) -> bool:
+        """Only ISO/IEC 15434 barcodes are supported by Mouser."""
+        return self.is_isoiec_15434_barcode2d(barcode_data)
+
     def extract_barcode_fields(self, barcode_data: str) -> dict[str, str]:
         """Get supplier_part and barcode_fields from Mouser DataMatrix-Code."""
 
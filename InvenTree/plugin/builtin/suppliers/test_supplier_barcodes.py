@@ -1,11 +1,16 @@
 """Tests barcode parsing for all suppliers."""
 
+from unittest import mock
+
 from django.urls import reverse
 
 from company.models import Company, ManufacturerPart, SupplierPart
 from InvenTree.unit_test import InvenTreeAPITestCase
 from order.models import PurchaseOrder, PurchaseOrderLineItem
 from part.models import Part
+from plugin import registry
+from plugin.base.barcodes.api import get_barcode_scanners
+from plugin.mixins import SupplierBarcodeMixin
 from stock.models import StockItem, StockLocation
 
 
@@ -80,6 +85,22 @@ class SupplierBarcodeTests(InvenTreeAPITestCase):
         supplier_part = SupplierPart.objects.get(pk=supplier_part_data["pk"])
         self.assertEqual(supplier_part.SKU, '1')
 
+    def test_scan_ignores_receive_fields(self):
+        """Test that the scan endpoint ignores the purchase_order and location fields."""
+
+        result = self.post(
+            self.SCAN_URL,
+            data={
+                "barcode": MOUSER_BARCODE,
+                "purchase_order": "abc",
+                "location": "abc",
+            },
+            expected_code=200
+        )
+
+        supplier_part = SupplierPart.objects.get(pk=result.data["supplierpart"]["pk"])
+        self.assertEqual(supplier_part.SKU, '1')
+
     def test_old_mouser_barcode(self):
         """Test old mouser barcode with messed up header."""
 
@@ -128,6 +149,24 @@ class SupplierBarcodeTests(InvenTreeAPITestCase):
         supplier_part = SupplierPart.objects.get(pk=supplier_part_data["pk"])
         self.assertEqual(supplier_part.SKU, 'WBP-302')
 
+    def test_can_handle(self):
+        """Test that supplier plugins quickly reject barcodes in other formats."""
+
+        digikey = registry.get_plugin('digikeyplugin')
+        mouser = registry.get_plugin('mouserplugin')
+        lcsc = registry.get_plugin('lcscplugin')
+
+        for plugin in [digikey, mouser]:
+            self.assertTrue(plugin.can_handle(DIGIKEY_BARCODE))
+            self.assertTrue(plugin.can_handle(MOUSER_BARCODE_OLD))
+            self.assertFalse(plugin.can_handle(LCSC_BARCODE))
+            self.assertFalse(plugin.can_handle(TME_QRCODE))
+
+        self.assertTrue(lcsc.can_handle(LCSC_BARCODE))
+        self.assertTrue(lcsc.can_handle(f" {LCSC_BARCODE}\n"))
+        self.assertFalse(lcsc.can_handle(MOUSER_BARCODE))
+        self.assertFalse(lcsc.can_handle(TME_DATAMATRIX_CODE))
+
 
 class SupplierBarcodePOReceiveTests(InvenTreeAPITestCase):
     """Tests barcode scanning to receive a purchase order item."""
@@ -284,6 +323,89 @@ class SupplierBarcodePOReceiveTests(InvenTreeAPITestCase):
         stock_item = StockItem.objects.get(pk=result2.data["stockitem"]["pk"])
         assert stock_item.location == stock_location2
 
+    def test_receive_invalid_order_and_location(self):
+        """Test receiving an item against an invalid order or location"""
+
+        url = reverse("api-barcode-po-receive")
+
+        response = self.post(url, data={
+            "barcode": MOUSER_BARCODE,
+            "purchase_order": 99999,
+        }, expected_code=400)
+
+        assert "Invalid purchase order" in str(response.data["purchase_order"])
+
+        response = self.post(url, data={
+            "barcode": MOUSER_BARCODE,
+            "location": 99999,
+        }, expected_code=400)
+
+        assert "Invalid stock location" in str(response.data["location"])
+
+        # Non-integer primary key values are also rejected
+        response = self.post(url, data={
+            "barcode": MOUSER_BARCODE,
+            "purchase_order": "abc",
+        }, expected_code=400)
+
+        assert "Invalid purchase order" in str(response.data["purchase_order"])
+
+        response = self.post(url, data={
+            "barcode": MOUSER_BARCODE,
+            "location": "abc",
+        }, expected_code=400)
+
+        assert "Invalid stock location" in str(response.data["location"])
+
+    def test_receive_without_instances(self):
+        """Test receiving for plugins which do not require order / location instances"""
+
+        stock_location = StockLocation.objects.create(name="Test Location")
+
+        url = reverse("api-barcode-po-receive")
+
+        # Bound scan methods are cached, so these must be rebuilt for the patched method
+        get_barcode_scanners.cache_clear()
+        self.addCleanup(get_barcode_scanners.cache_clear)
+
+        with mock.patch.object(SupplierBarcodeMixin, 'needs_purchase_order_instance', False), \
+                mock.patch.object(SupplierBarcodeMixin, 'needs_location_instance', False), \
+                mock.patch.object(SupplierBarcodeMixin, 'scan_receive_item', return_value={'success': 'Received'}) as scan_receive_item:
+
+            # Invalid primary keys are still rejected
+            response = self.post(url, data={
+                "barcode": MOUSER_BARCODE,
+                "purchase_order": 99999,
+            }, expected_code=400)
+
+            assert "Invalid purchase order" in str(response.data["purchase_order"])
+
+            response = self.post(url, data={
+                "barcode": MOUSER_BARCODE,
+                "location": 99999,
+            }, expected_code=400)
+
+            assert "Invalid stock location" in str(response.data["location"])
+
+            scan_receive_item.assert_not_called()
+
+            # Valid primary keys are passed through to the plugin (rather than model instances)
+            response = self.post(url, data={
+                "barcode": MOUSER_BARCODE,
+                "purchase_order": self.purchase_order2.pk,
+                "location": stock_location.pk,
+            }, expected_code=200)
+
+            assert response.data["success"] == "Received"
+
+            scan_receive_item.assert_called_once()
+
+            kwargs = scan_receive_item.call_args.kwargs
+            assert kwargs["purchase_order"] == self.purchase_order2.pk
+            assert type(kwargs["purchase_order"]) is int
+            assert kwargs["location"] == stock_location.pk
+            assert type(kwargs["location"]) is int
+
     def test_receive_missing_quantity(self):
         """Test receiving an with missing quantity information"""
 
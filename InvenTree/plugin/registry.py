@@ -57,6 +57,10 @@ class PluginsRegistry:
         # Keep an internal hash of the plugin registry state
         self.registry_hash = None
 
+        # Cache of with_mixin() lookups, invalidated whenever the registry changes
+        self.registry_version = 0                               # Incremented each time plugins are (un)loaded
+        self._mixin_cache: Dict[tuple, tuple] = {}              # Maps (mixin, builtin) to matching plugins
+
         self.plugin_modules: List[InvenTreePlugin] = []         # Holds all discovered plugins
         self.mixin_modules: Dict[str, Any] = {}                 # Holds all discovered mixins
 
@@ -126,10 +130,19 @@ class PluginsRegistry:
 
     # region registry functions
     def with_mixin(self, mixin: str, active=None, builtin=None):
-        """Returns reference to all plugins that have a specified mixin enabled."""
+        """Returns reference to all plugins that have a specified mixin enabled.
+
+        Lookups which do not filter by 'active' status are cached until the registry is next (un)loaded.
+        """
         # Check if the registry needs to be loaded
         self.check_reload()
 
+        # The 'active' status is stored in the database, so is not cached
+        cache_key = (mixin, builtin) if active is None and not self.is_loading else None
+
+        if cache_key is not None and cache_key in self._mixin_cache:
+            return self._mixin_cache[cache_key]
+
         result = []
 
         for plugin in self.plugins.values():
@@ -147,7 +160,17 @@ class PluginsRegistry:
 
                 result.append(plugin)
 
+        result = tuple(result)
+
+        if cache_key is not None:
+            self._mixin_cache[cache_key] = result
+
         return result
+
+    def invalidate_mixin_cache(self):
+        """Discard any cached with_mixin() lookups, and bump the registry version."""
+        self._mixin_cache = {}
+        self.registry_version += 1
     # endregion
 
     # region loading / unloading
@@ -207,6 +230,9 @@ class PluginsRegistry:
         # ensure plugins_loaded is True
         self.plugins_loaded = True
 
+        # Any lookups made while loading may be out of date
+        self.invalidate_mixin_cache()
+
         # Remove maintenance mode
         if not _maintenance:
             set_maintenance_mode(False)
@@ -604,6 +630,8 @@ class PluginsRegistry:
         self.plugins_inactive: Dict[str, InvenTreePlugin] = {}
         self.plugins_full: Dict[str, InvenTreePlugin] = {}
 
+        self.invalidate_mixin_cache()
+
     def _update_urls(self):
         """Due to the order in which plugins are loaded, the patterns in urls.py may be out of date.
 
@@ -274,3 +274,28 @@ class RegistryTests(TestCase):
         # There should be at least one load error with an intentional KeyError
         self.assertTrue(len(registry.errors.get('load')) > 0)
         self.assertEqual(registry.errors.get('load')[0]['broken_sample'], "'This is a dummy error'")
+
+    def test_mixin_cache(self):
+        """Test that with_mixin lookups are cached until the registry is reloaded."""
+        barcode_plugins = registry.with_mixin('barcode')
+        self.assertIs(registry.with_mixin('barcode'), barcode_plugins)
+
+        # Builtin filter is cached separately
+        builtin_plugins = registry.with_mixin('barcode', builtin=True)
+        self.assertIsNot(builtin_plugins, barcode_plugins)
+        self.assertIs(registry.with_mixin('barcode', builtin=True), builtin_plugins)
+
+        # Lookups filtered by 'active' status are not cached
+        self.assertIsNot(registry.with_mixin('barcode', active=True), registry.with_mixin('barcode', active=True))
+
+        version = registry.registry_version
+
+        # Reloading the registry invalidates the cache
+        registry.reload_plugins(full_reload=True)
+
+        self.assertGreater(registry.registry_version, version)
+        self.assertIsNot(registry.with_mixin('barcode'), barcode_plugins)
+        self.assertEqual(
+            [p.slug for p in registry.with_mixin('barcode')],
+            [p.slug for p in barcode_plugins]
+        )
@@ -351,6 +351,9 @@ class StockItem(InvenTreeBarcodeMixin, InvenTreeNotesMixin, MetadataMixin, commo
         packaging: Description of how the StockItem is packaged (e.g. "reel", "loose", "tape" etc)
     """
 
+    # Related fields which are accessed by StockItem.clean()
+    BARCODE_SELECT_RELATED = ('part', 'location', 'supplier_part__part')
+
     @staticmethod
     def get_api_url():
         """Return API url."""
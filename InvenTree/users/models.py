@@ -28,6 +28,11 @@ from InvenTree.ready import canAppAccessDatabase
 
 logger = logging.getLogger("inventree")
 
+# Incremented whenever user roles change, which invalidates all cached table permission checks.
+# Note: the table permission cache is stored against each user instance as '_table_perm_cache',
+# as the '_perm_cache' attribute is already used by the django ModelBackend
+_table_perm_cache_version = 0
+
 
 #  OVERRIDE START
 # Overrides Django User model __str__ with a custom function to be able to change
@@ -411,11 +416,31 @@ class RuleSet(models.Model):
 
     @classmethod
     def check_table_permission(cls, user, table, permission):
-        """Check if the provided user has the specified permission against the table."""
+        """Check if the provided user has the specified permission against the table.
+
+        Results are cached against the provided user instance, until any user roles are changed.
+        For an API request, this means that each table / permission combination is only checked once per request.
+        """
         # Superuser knows no bounds
         if user.is_superuser:
             return True
 
+        cache_version, perm_cache = getattr(user, '_table_perm_cache', (None, None))
+
+        if cache_version != _table_perm_cache_version:
+            perm_cache = {}
+            user._table_perm_cache = (_table_perm_cache_version, perm_cache)
+
+        key = (user.pk, table, permission)
+
+        if key not in perm_cache:
+            perm_cache[key] = cls._check_table_permission(user, table, permission)
+
+        return perm_cache[key]
+
+    @classmethod
+    def _check_table_permission(cls, user, table, permission):
+        """Check (without caching) if the provided user has the specified permission against the table."""
         # If the table does *not* require permissions
         if table in cls.RULESET_IGNORE:
             return True
@@ -678,6 +703,10 @@ def clear_user_role_cache(user):
             key = f"role_{user}_{role}_{perm}"
             cache.delete(key)
 
+    # Also invalidate any table permissions cached against user instances
+    global _table_perm_cache_version
+    _table_perm_cache_version += 1
+
 
 def get_user_roles(user):
     """Return all roles available to a given user"""
@@ -717,27 +746,13 @@ def check_user_role(user, role, permission):
     # Default for no match
     result = False
 
-    for group in user.groups.all():
-
-        for rule in group.rule_sets.all():
-
-            if rule.name == role:
-
-                if permission == 'add' and rule.can_add:
-                    result = True
-                    break
-
-                if permission == 'change' and rule.can_change:
-                    result = True
-                    break
-
-                if permission == 'view' and rule.can_view:
-                    result = True
-                    break
-
-                if permission == 'delete' and rule.can_delete:
-                    result = True
-                    break
+    # Check all of the user's groups in a single query
+    if user.pk is not None and f'can_{permission}' in RuleSet.RULE_OPTIONS:
+        result = RuleSet.objects.filter(
+            group__user=user,
+            name=role,
+            **{f'can_{permission}': True}
+        ).exists()
 
     # Save result to cache
     cache.set(key, result, timeout=3600)
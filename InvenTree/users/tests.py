@@ -1,12 +1,13 @@
 """Unit tests for the 'users' app"""
 
 from django.apps import apps
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.test import TestCase
 from django.urls import reverse
 
-from InvenTree.unit_test import InvenTreeTestCase
-from users.models import ApiToken, Owner, RuleSet
+from InvenTree.unit_test import InvenTreeAPITestCase, InvenTreeTestCase
+from users.models import ApiToken, Owner, RuleSet, clear_user_role_cache
 
 
 class RuleSetModelTest(TestCase):
@@ -151,6 +152,76 @@ class RuleSetModelTest(TestCase):
         # There should now not be any permissions assigned to this group
         self.assertEqual(group.permissions.count(), 0)
 
+    def test_table_permission_cache(self):
+        """Test that table permission checks are cached against the user instance."""
+        group = Group.objects.create(name="Cache group")
+        user = get_user_model().objects.create_user(username='cache_user', password='cache_password')
+        user.groups.add(group)
+
+        ruleset = group.rule_sets.get(name='stock')
+        ruleset.can_change = True
+        ruleset.save()
+
+        self.assertTrue(RuleSet.check_table_permission(user, 'stock_stockitem', 'change'))
+        self.assertFalse(RuleSet.check_table_permission(user, 'part_part', 'change'))
+
+        # Subsequent checks do not hit the database
+        with self.assertNumQueries(0):
+            self.assertTrue(RuleSet.check_table_permission(user, 'stock_stockitem', 'change'))
+            self.assertFalse(RuleSet.check_table_permission(user, 'part_part', 'change'))
+
+        # A fresh user instance (i.e. a new request) sees updated permissions
+        ruleset = group.rule_sets.get(name='part')
+        ruleset.can_change = True
+        ruleset.save()
+
+        user.save()
+        user = get_user_model().objects.get(pk=user.pk)
+
+        self.assertTrue(RuleSet.check_table_permission(user, 'part_part', 'change'))
+
+
+class TablePermissionCacheTest(InvenTreeAPITestCase):
+    """Tests for the table permission cache against user instances."""
+
+    fixtures = [
+        'location',
+    ]
+
+    def test_django_perm_cache(self):
+        """Test that the table permission cache does not interfere with the django permission cache."""
+        user = get_user_model().objects.get(pk=self.user.pk)
+
+        # Calling has_perm() populates the django ModelBackend permission cache
+        self.assertFalse(user.has_perm('stock.change_stocklocation'))
+        self.assertFalse(RuleSet.check_table_permission(user, 'stock_stocklocation', 'change'))
+        self.assertFalse(user.has_perm('stock.change_stocklocation'))
+
+        # Clearing the role cache must also leave the django permission cache intact
+        clear_user_role_cache(user)
+        self.assertFalse(user.has_perm('stock.change_stocklocation'))
+        self.assertFalse(RuleSet.check_table_permission(user, 'stock_stocklocation', 'change'))
+
+        # Changing the user roles invalidates table permissions cached against this instance
+        self.assignRole('stock_location.change')
+        self.assertTrue(RuleSet.check_table_permission(user, 'stock_stocklocation', 'change'))
+
+        # A fresh user instance picks up the new django permissions
+        user = get_user_model().objects.get(pk=self.user.pk)
+        self.assertTrue(RuleSet.check_table_permission(user, 'stock_stocklocation', 'change'))
+        self.assertTrue(user.has_perm('stock.change_stocklocation'))
+        self.assertTrue(RuleSet.check_table_permission(user, 'stock_stocklocation', 'change'))
+
+    def test_assign_role_between_requests(self):
+        """Test that role changes between API requests are respected."""
+        url = reverse('api-location-detail', kwargs={'pk': 1})
+
+        self.patch(url, {'description': 'A new description'}, expected_code=403)
+
+        self.assignRole('stock_location.change')
+
+        self.patch(url, {'description': 'A new description'}, expected_code=200)
+
 
 class OwnerModelTest(InvenTreeTestCase):
     """Some simplistic tests to ensure the Owner model is setup correctly."""